@@ -1,194 +1,598 @@
+import hashlib
+import re
+import sys
+from collections import OrderedDict
+from decimal import Decimal
+
 import pandas as pd
 import numpy as np
+from joblib import Parallel, delayed
+
+# pyarrow es opcional: si está instalado las expresiones regulares sobre
+# cadenas se evalúan con los kernels de Arrow
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+
+# Cantidad de cadenas que se intentan convertir a float de una sola vez
+TAMANO_TRAMO = 1_000
+
+# Proporción máxima de valores distintos para verificar una columna
+# a través de sus valores únicos en lugar de fila por fila
+UMBRAL_CARDINALIDAD = 0.5
+
+# Filas que se usan para estimar la cardinalidad de una columna
+TAMANO_MUESTRA = 10_000
+
+# Cantidad de filas que se evalúan a la vez valor por valor
+TAMANO_BLOQUE = 1_000_000
+
+# La referencia para decidir si una cadena es numérica es float() sobre la
+# cadena sin espacios. Con pyarrow, las cadenas que numpy no pudo convertir
+# se clasifican con dos patrones en lugar de llamar a float() en cada fila:
+#   - PATRON_NUMERICO: cadenas ASCII que float() siempre acepta (decimales,
+#     notación científica, inf/infinity y nan, con espacios alrededor)
+#   - PATRON_NO_NUMERICO: cadenas con algún carácter ASCII que float() nunca
+#     acepta (ni dígito, ni signo, ni '.', '_', ni letra de e/inf/infinity/nan,
+#     ni espacio que str.strip() quite)
+# Las cadenas que no coinciden con ninguno (guiones bajos, dígitos o
+# espacios no ASCII, etc.) se verifican con float()
+PATRON_NUMERICO = (r'^[ \t\n\r\f\v]*[+-]?(?:(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?'
+                   r'|[iI][nN][fF](?:[iI][nN][iI][tT][yY])?|[nN][aA][nN])[ \t\n\r\f\v]*$')
+PATRON_NO_NUMERICO = (r'[\x00-\x08\x0e-\x1b\x21-\x2a\x2c\x2f\x3a-\x40B-DG-HJ-MO-SU-XZ-\x5e'
+                      r'\x60b-dg-hj-mo-su-xz-\x7f]')
+
+# Los caracteres de PATRON_NO_NUMERICO, para descartar cadenas sin pyarrow
+_CARACTERES_NO_NUMERICOS = frozenset(filter(re.compile(PATRON_NO_NUMERICO).match,
+                                            map(chr, range(128))))
 
+# Tipos de Python que siempre se consideran numéricos
+TIPOS_NUMERICOS = {int, float, Decimal, np.int32, np.int64, np.float32, np.float64}
 
-def verificar_columna_numerica(df, columna, verbose=True):
+# Máscaras de valores no numéricos ya calculadas, por columna y contenido
+TAMANO_CACHE = 128
+_cache_mascaras = OrderedDict()
+
+
+def _es_escalar_numerico(valor):
     """
-    Verifica si una columna contiene solo datos numéricos.
-    
+    Indica si un valor individual puede convertirse a float.
+
     Args:
-        df (pd.DataFrame): DataFrame que contiene los datos
-        columna (str): Nombre de la columna a verificar
-        verbose (bool): Si True, muestra información detallada
-    
+        valor: Valor a verificar
+
     Returns:
-        dict: Diccionario con información sobre la verificación:
-            - 'es_numerica': bool, True si todos los datos son numéricos
-            - 'tipo_dato': tipo de dato de la columna
-            - 'valores_no_numericos': lista de valores no numéricos encontrados
-            - 'cantidad_no_numericos': cantidad de valores no numéricos
-            - 'indices_no_numericos': índices donde están los valores no numéricos
-    
-    Raises:
-        ValueError: Si la columna no existe en el DataFrame
+        bool: True si el valor es un número o una cadena numérica
+    """
+    if isinstance(valor, (int, float, Decimal, np.number)):
+        return True
+
+    try:
+        float(valor.strip() if isinstance(valor, str) else valor)
+    except (ValueError, TypeError):
+        return False
+    return True
+
+
+# Versión de _es_escalar_numerico que recorre arreglos de objetos en C
+_es_escalar_numerico_ufunc = np.frompyfunc(_es_escalar_numerico, 1, 1)
+
+
+def _es_cadena_numerica(cadena):
+    """
+    Indica si una cadena puede convertirse a float.
+
+    Es _es_escalar_numerico sin las comprobaciones de tipo, para arreglos
+    que solo contienen cadenas.
+
+    Args:
+        cadena (str): Cadena a verificar
+
+    Returns:
+        bool: True si float() acepta la cadena sin espacios
+    """
+    try:
+        float(cadena.strip())
+    except ValueError:
+        return False
+    return True
+
+
+_es_cadena_numerica_ufunc = np.frompyfunc(_es_cadena_numerica, 1, 1)
+
+
+def _mascara_cadenas(valores):
+    """
+    Calcula qué cadenas de un arreglo no pueden convertirse a número.
+
+    Con pyarrow, la mayoría de las cadenas se clasifican con PATRON_NUMERICO
+    y PATRON_NO_NUMERICO. Sin pyarrow, o si Arrow no puede codificar las
+    cadenas, se descartan las que tienen algún carácter de
+    _CARACTERES_NO_NUMERICOS. En ambos casos solo las dudosas pasan por
+    float().
+
+    Args:
+        valores (np.ndarray): Arreglo de objetos con cadenas no nulas
+
+    Returns:
+        np.ndarray: Máscara booleana, True donde el valor no es numérico
+    """
+    texto = None
+    if pa is not None:
+        try:
+            # Las cadenas se copian a un buffer contiguo de Arrow
+            texto = pa.array(valores, type=pa.string())
+        except UnicodeEncodeError:
+            # Arrow solo admite UTF-8 válido (no surrogates sueltos)
+            pass
+
+    if texto is not None:
+        acepta = pc.match_substring_regex(texto, PATRON_NUMERICO).to_numpy(zero_copy_only=False)
+        rechaza = pc.match_substring_regex(texto, PATRON_NO_NUMERICO)
+        dudosos = ~acepta & ~rechaza.to_numpy(zero_copy_only=False)
+    else:
+        # Buscar caracteres en un conjunto no lanza excepciones, a diferencia
+        # de float(), y descarta enseguida la mayoría del texto no numérico
+        acepta = np.zeros(len(valores), dtype=bool)
+        dudosos = np.fromiter(map(_CARACTERES_NO_NUMERICOS.isdisjoint, valores),
+                              dtype=bool, count=len(valores))
+
+    bad_mask = ~acepta
+    if dudosos.any():
+        bad_mask[dudosos] = ~_es_cadena_numerica_ufunc(valores[dudosos]).astype(bool)
+    return bad_mask
+
+
+def _mascara_texto(serie):
+    """
+    Calcula qué cadenas no nulas de una serie no pueden convertirse a número.
+
+    Las cadenas se convierten por tramos de TAMANO_TRAMO con numpy, que
+    llama a float() en C sin una excepción por fila. Los tramos que se
+    convierten completos no tienen problemas; las cadenas de los demás se
+    clasifican con _mascara_cadenas, por bloques de TAMANO_BLOQUE filas
+    para no duplicar la memoria en columnas grandes.
+
+    Args:
+        serie (pd.Series): Serie de cadenas (y nulos) a verificar
+
+    Returns:
+        np.ndarray: Máscara booleana, True donde el valor no es numérico
+    """
+    arr = serie.to_numpy(dtype=object)
+    notna = serie.notna().to_numpy()
+    revisar = notna.copy()
+    for inicio in range(0, len(arr), TAMANO_TRAMO):
+        tramo = slice(inicio, inicio + TAMANO_TRAMO)
+        try:
+            arr[tramo][notna[tramo]].astype(np.float64)
+        except ValueError:
+            continue
+        revisar[tramo] = False
+
+    bad_mask = np.zeros(len(arr), dtype=bool)
+    for inicio in range(0, len(arr), TAMANO_BLOQUE):
+        bloque = slice(inicio, inicio + TAMANO_BLOQUE)
+        filas = revisar[bloque]
+        if filas.any():
+            bad_mask[bloque][filas] = _mascara_cadenas(arr[bloque][filas])
+    return bad_mask
+
+
+def _mascara_no_numericos(serie, tipo_inferido):
+    """
+    Calcula qué valores no nulos de una serie no pueden convertirse a número.
+
+    El método depende del contenido de la serie, en este orden:
+        1. Solo cadenas: _mascara_texto (conversión por tramos con numpy;
+           lo que no se convierte pasa por _mascara_cadenas, con pyarrow si
+           está instalado y si no con float()).
+        2. Tipos mezclados: los números de TIPOS_NUMERICOS son válidos, las
+           cadenas pasan por _mascara_texto y el resto por
+           _es_escalar_numerico.
+
+    Args:
+        serie (pd.Series): Serie a verificar
+        tipo_inferido (str): Resultado de pd.api.types.infer_dtype para la serie
+
+    Returns:
+        np.ndarray: Máscara booleana, True donde el valor no es numérico
+    """
+    if tipo_inferido == 'string':
+        return _mascara_texto(serie)
+
+    # Tipos mezclados: separar las filas por tipo. Los números son válidos,
+    # las cadenas se convierten juntas y solo el resto se evalúa uno a uno
+    arr = serie.to_numpy(dtype=object)
+    tipos = serie.map(type)
+    es_texto = tipos.eq(str).to_numpy()
+    es_numero = tipos.isin(TIPOS_NUMERICOS).to_numpy()
+    otros = ~(es_texto | es_numero) & serie.notna().to_numpy()
+
+    bad_mask = np.zeros(len(arr), dtype=bool)
+    if es_texto.any():
+        bad_mask[es_texto] = _mascara_texto(serie[es_texto])
+    if otros.any():
+        bad_mask[otros] = ~_es_escalar_numerico_ufunc(arr[otros]).astype(bool)
+    return bad_mask
+
+
+def _mascara_columna(serie, tipo_inferido=None):
+    """
+    Calcula la máscara de valores no numéricos de una columna no numérica.
+
+    Si los valores ya son números no se recorre la columna. Si tiene pocos
+    valores distintos, solo se verifican los valores únicos. En los demás
+    casos se usa _mascara_no_numericos sobre la columna completa.
+
+    Args:
+        serie (pd.Series): Serie a verificar
+        tipo_inferido (str): Resultado de pd.api.types.infer_dtype para la
+            serie. Si es None, se calcula aquí
+
+    Returns:
+        np.ndarray: Máscara booleana, True donde el valor no es numérico
+    """
+    # Inferir el tipo real de los valores (objetos que ya son números, etc.)
+    # una sola vez; las funciones auxiliares reciben el resultado
+    if tipo_inferido is None:
+        tipo_inferido = pd.api.types.infer_dtype(serie, skipna=True)
+
+    # Si no es numérico, intentar convertir y encontrar problemas
+    if tipo_inferido in ('integer', 'floating', 'decimal', 'mixed-integer-float', 'empty'):
+        # Todos los valores no nulos ya son números: no hace falta recorrerlos
+        bad_mask = np.zeros(len(serie), dtype=bool)
+    else:
+        codigos = unicos = None
+        try:
+            # Estimar la cardinalidad con una muestra antes de agrupar toda
+            # la columna, para no pagar el agrupamiento cuando no conviene
+            muestra = serie.sample(min(len(serie), TAMANO_MUESTRA), random_state=0)
+            if muestra.nunique() < UMBRAL_CARDINALIDAD * len(muestra):
+                codigos, unicos = pd.factorize(serie, sort=False)
+        except TypeError:
+            # Valores no hashables (listas, dicts...): no se pueden agrupar
+            pass
+
+        if unicos is not None and len(unicos) < UMBRAL_CARDINALIDAD * len(serie):
+            # Pocos valores distintos: verificar solo los valores únicos y
+            # propagar el resultado a cada fila mediante los códigos
+            mascara_unicos = _mascara_no_numericos(pd.Series(unicos, dtype=object),
+                                                   tipo_inferido)
+            bad_mask = (codigos >= 0) & mascara_unicos[codigos]
+        else:
+            bad_mask = _mascara_no_numericos(serie, tipo_inferido)
+
+    return bad_mask
+
+
+def _mascara_con_cache(serie, columna):
+    """
+    Igual que _mascara_columna, pero reutiliza el resultado si la misma
+    columna (mismo nombre, tipo y contenido) ya se verificó antes.
+
+    Args:
+        serie (pd.Series): Serie a verificar
+        columna (str): Nombre de la columna
+
+    Returns:
+        np.ndarray: Máscara booleana, True donde el valor no es numérico
+    """
+    tipo_inferido = pd.api.types.infer_dtype(serie, skipna=True)
+    try:
+        # La huella depende del orden de las filas: la máscara es posicional
+        hashes = pd.util.hash_pandas_object(serie, index=False, categorize=False).to_numpy()
+        huella = hashlib.blake2b(hashes.tobytes(), digest_size=16)
+    except (TypeError, ValueError, UnicodeEncodeError):
+        # Listas, diccionarios o cadenas que no se pueden codificar: no se
+        # puede usar el cache
+        return _mascara_columna(serie, tipo_inferido)
+
+    if tipo_inferido != 'string':
+        # hash_pandas_object convierte a texto los objetos de tipos mezclados
+        # (True y 'True' dan el mismo hash), por eso la huella incluye
+        # también el tipo de cada fila
+        codigos, tipos = pd.factorize(serie.map(type))
+        huella.update(codigos.tobytes())
+        huella.update(repr(list(tipos)).encode())
+
+    clave = (columna, str(serie.dtype), tipo_inferido, len(serie), huella.hexdigest())
+    if clave in _cache_mascaras:
+        _cache_mascaras.move_to_end(clave)
+        return _cache_mascaras[clave].copy()
+
+    bad_mask = _mascara_columna(serie, tipo_inferido)
+    _cache_mascaras[clave] = bad_mask.copy()
+    if len(_cache_mascaras) > TAMANO_CACHE:
+        _cache_mascaras.popitem(last=False)
+
+    return bad_mask
+
+
+def _reducir_tipo(serie):
+    """
+    Reduce el tamaño en memoria de una serie cambiando su tipo de dato.
+
+    Las columnas enteras se convierten al tipo entero más pequeño que las
+    contiene, las float64 a float32 solo si ningún valor cambia, y las
+    columnas de texto con pocos valores distintos a 'category'.
+
+    Args:
+        serie (pd.Series): Serie a reducir
+
+    Returns:
+        pd.Series: Serie con el tipo reducido (o la misma serie si no aplica)
+    """
+    if pd.api.types.is_bool_dtype(serie):
+        return serie
+    if pd.api.types.is_integer_dtype(serie):
+        return pd.to_numeric(serie, downcast='integer')
+    if serie.dtype == np.float64:
+        # Solo se pasa a float32 si todos los valores se conservan exactamente
+        reducida = serie.astype(np.float32)
+        if np.array_equal(reducida.to_numpy(dtype=np.float64), serie.to_numpy(),
+                          equal_nan=True):
+            return reducida
+        return serie
+    if pd.api.types.is_object_dtype(serie):
+        try:
+            if serie.nunique() < UMBRAL_CARDINALIDAD * len(serie):
+                return serie.astype('category')
+        except TypeError:
+            # Valores no hashables: se deja la columna como está
+            pass
+    return serie
+
+
+def _mostrar_resultado(resultado, columna, max_show=50, tipo_numerico=False):
     """
+    Muestra el detalle de la verificación de una columna.
+
+    Args:
+        resultado (dict): Resultado de _verificar_serie con verbose=True
+        columna (str): Nombre de la columna
+        max_show (int): Máximo de valores no numéricos a mostrar en el detalle
+        tipo_numerico (bool): True si el tipo de dato de la columna ya es numérico
+    """
+    if tipo_numerico:
+        sys.stdout.write(
+            f"✓ La columna '{columna}' es numérica\n"
+            f"  - Tipo de dato: {resultado['tipo_dato']}\n"
+            f"  - Total de valores: {resultado['total_valores']}\n"
+            f"  - Valores nulos: {resultado['valores_nulos']}\n"
+        )
+        return
     
-    # Verificar que la columna existe
-    if columna not in df.columns:
-        raise ValueError(f"La columna '{columna}' no existe en el DataFrame. "
-                        f"Columnas disponibles: {list(df.columns)}")
+    valores_no_numericos = resultado['valores_no_numericos']
+    indices_no_numericos = resultado['indices_no_numericos']
     
-    # Obtener la serie
-    serie = df[columna]
+    # Las líneas se acumulan y se escriben de una sola vez
+    out = []
+    if resultado['es_numerica']:
+        out.append(f"✓ La columna '{columna}' contiene solo datos numéricos")
+        out.append(f"  - Tipo de dato actual: {resultado['tipo_dato']} (puede convertirse a numérico)")
+        out.append(f"  - Total de valores: {resultado['total_valores']}")
+        out.append(f"  - Valores nulos: {resultado['valores_nulos']}")
+        
+        # Mostrar detalles de valores nulos si existen
+        if resultado['valores_nulos'] > 0:
+            out.append(f"\n{'='*70}")
+            out.append(f"DETALLE DE VALORES NULOS:")
+            out.append(f"{'='*70}")
+            out.append(f"Índices con valores nulos: {resultado['indices_nulos']}")
+            out.append(f"{'='*70}")
+    else:
+        out.append(f"✗ La columna '{columna}' NO es completamente numérica")
+        out.append(f"  - Tipo de dato: {resultado['tipo_dato']}")
+        out.append(f"  - Total de valores: {resultado['total_valores']}")
+        out.append(f"  - Valores nulos: {resultado['valores_nulos']}")
+        out.append(f"  - Valores no numéricos encontrados: {resultado['cantidad_no_numericos']}")
+        
+        # Mostrar detalles de valores nulos si existen
+        if resultado['valores_nulos'] > 0:
+            out.append(f"\n{'='*70}")
+            out.append(f"DETALLE DE VALORES NULOS:")
+            out.append(f"{'='*70}")
+            out.append(f"Índices con valores nulos: {resultado['indices_nulos']}")
+            out.append(f"{'='*70}")
+        
+        # Mostrar detalles de valores no numéricos
+        out.append(f"\n{'='*70}")
+        out.append(f"DETALLE DE VALORES NO NUMÉRICOS:")
+        out.append(f"{'='*70}")
+        
+        # Mostrar hasta max_show valores no numéricos (truncando valores muy largos)
+        mostrados = len(valores_no_numericos) if max_show is None else max_show
+        valores = pd.Series(valores_no_numericos[:mostrados], dtype=object)
+        texto = valores.astype(str)
+        reporte = pd.DataFrame({
+            'Índice': indices_no_numericos[:mostrados],
+            'Valor': texto.where(texto.str.len() <= 30, texto.str[:27] + '...'),
+            'Tipo': valores.map(type).map(lambda t: t.__name__),
+        })
+        if len(reporte) > 0:
+            out.append(reporte.to_string(index=False))
+        
+        omitidos = len(valores_no_numericos) - len(valores)
+        if omitidos > 0:
+            out.append(f"... ({omitidos} filas omitidas)")
+        
+        out.append(f"{'='*70}")
+
+    sys.stdout.write('\n'.join(out) + '\n')
+
+
+def _verificar_serie(serie, columna, verbose=True, max_show=50, usar_cache=False,
+                     mostrar=True):
+    """
+    Verifica si una serie contiene solo datos numéricos.
+
+    Hace el trabajo de verificar_columna_numerica sobre la serie ya
+    extraída, sin volver a comprobar que la columna existe.
+
+    Args:
+        serie (pd.Series): Serie a verificar
+        columna (str): Nombre de la columna (para los mensajes y el cache)
+        verbose (bool): Si True, incluye los valores no numéricos en el
+            resultado y (si mostrar es True) muestra información detallada
+        max_show (int): Máximo de valores no numéricos a mostrar en el detalle
+        usar_cache (bool): Si True, reutiliza verificaciones anteriores
+        mostrar (bool): Si False, no se imprime nada aunque verbose sea True.
+            Permite mostrar el resultado después con _mostrar_resultado
+
+    Returns:
+        dict: Diccionario con el mismo formato que verificar_columna_numerica
+    """
+    null_mask = serie.isna().to_numpy()
     
     # Información inicial
     resultado = {
         'es_numerica': False,
         'tipo_dato': str(serie.dtype),
-        'valores_no_numericos': [],
+        'valores_no_numericos': [] if verbose else None,
         'cantidad_no_numericos': 0,
-        'indices_no_numericos': [],
+        'indices_no_numericos': serie.index[:0],
+        'mask_no_numericos': np.zeros(len(serie), dtype=bool),
         'total_valores': len(serie),
-        'valores_nulos': serie.isnull().sum(),
-        'indices_nulos': serie[serie.isnull()].index.tolist()
+        'valores_nulos': int(null_mask.sum()),
+        'indices_nulos': serie.index[null_mask].tolist()
     }
     
     # Si el tipo ya es numérico (int, float)
     if pd.api.types.is_numeric_dtype(serie):
         resultado['es_numerica'] = True
         
-        if verbose:
-            print(f"✓ La columna '{columna}' es numérica")
-            print(f"  - Tipo de dato: {resultado['tipo_dato']}")
-            print(f"  - Total de valores: {resultado['total_valores']}")
-            print(f"  - Valores nulos: {resultado['valores_nulos']}")
+        if verbose and mostrar:
+            _mostrar_resultado(resultado, columna, max_show, tipo_numerico=True)
         
         return resultado
     
-    # Si no es numérico, intentar convertir y encontrar problemas
-    valores_no_numericos = []
-    indices_no_numericos = []
-    
-    for idx, valor in serie.items():
-        # Ignorar valores nulos (NaN, None)
-        if pd.isnull(valor):
-            continue
-        
-        # Intentar convertir a número
-        try:
-            # Limpiar espacios si es string
-            if isinstance(valor, str):
-                valor = valor.strip()
-            
-            # Intentar conversión a float
-            float(valor)
-        except (ValueError, TypeError):
-            valores_no_numericos.append(valor)
-            indices_no_numericos.append(idx)
-    
-    # Actualizar resultado
-    resultado['valores_no_numericos'] = valores_no_numericos
-    resultado['cantidad_no_numericos'] = len(valores_no_numericos)
+    # Si no es numérico, buscar los valores que no pueden convertirse
+    if usar_cache:
+        bad_mask = _mascara_con_cache(serie, columna)
+    else:
+        bad_mask = _mascara_columna(serie)
+
+    indices_no_numericos = serie.index[bad_mask]
+
+    # Actualizar resultado. Los valores solo se copian a una lista si se
+    # van a mostrar; para usarlos basta con la máscara o los índices
+    resultado['mask_no_numericos'] = bad_mask
+    resultado['cantidad_no_numericos'] = len(indices_no_numericos)
     resultado['indices_no_numericos'] = indices_no_numericos
-    resultado['es_numerica'] = len(valores_no_numericos) == 0
-    
-    # Mostrar información si verbose está activado
+    resultado['es_numerica'] = len(indices_no_numericos) == 0
     if verbose:
-        if resultado['es_numerica']:
-            print(f"✓ La columna '{columna}' contiene solo datos numéricos")
-            print(f"  - Tipo de dato actual: {resultado['tipo_dato']} (puede convertirse a numérico)")
-            print(f"  - Total de valores: {resultado['total_valores']}")
-            print(f"  - Valores nulos: {resultado['valores_nulos']}")
-            
-            # Mostrar detalles de valores nulos si existen
-            if resultado['valores_nulos'] > 0:
-                print(f"\n{'='*70}")
-                print(f"DETALLE DE VALORES NULOS:")
-                print(f"{'='*70}")
-                print(f"Índices con valores nulos: {resultado['indices_nulos']}")
-                print(f"{'='*70}")
-        else:
-            print(f"✗ La columna '{columna}' NO es completamente numérica")
-            print(f"  - Tipo de dato: {resultado['tipo_dato']}")
-            print(f"  - Total de valores: {resultado['total_valores']}")
-            print(f"  - Valores nulos: {resultado['valores_nulos']}")
-            print(f"  - Valores no numéricos encontrados: {resultado['cantidad_no_numericos']}")
-            
-            # Mostrar detalles de valores nulos si existen
-            if resultado['valores_nulos'] > 0:
-                print(f"\n{'='*70}")
-                print(f"DETALLE DE VALORES NULOS:")
-                print(f"{'='*70}")
-                print(f"Índices con valores nulos: {resultado['indices_nulos']}")
-                print(f"{'='*70}")
-            
-            # Mostrar detalles de valores no numéricos
-            print(f"\n{'='*70}")
-            print(f"DETALLE DE VALORES NO NUMÉRICOS:")
-            print(f"{'='*70}")
-            print(f"{'Índice':<10} {'Valor':<30} {'Tipo':<20}")
-            print(f"{'-'*70}")
-            
-            # Mostrar TODOS los valores no numéricos
-            for idx, val in zip(indices_no_numericos, valores_no_numericos):
-                # Truncar valores muy largos
-                val_str = str(val)[:27] + '...' if len(str(val)) > 30 else str(val)
-                tipo_val = type(val).__name__
-                print(f"{idx:<10} {val_str:<30} {tipo_val:<20}")
-            
-            print(f"{'='*70}")
+        valores_no_numericos = serie[bad_mask].tolist()
+        resultado['valores_no_numericos'] = valores_no_numericos
+    
+    if verbose and mostrar:
+        _mostrar_resultado(resultado, columna, max_show)
     
     return resultado
 
 
-def verificar_multiples_columnas(df, columnas=None, verbose=True):
+def verificar_columna_numerica(df, columna, verbose=True, max_show=50, downcast=False,
+                               usar_cache=False):
     """
-    Verifica múltiples columnas del DataFrame.
+    Verifica si una columna contiene solo datos numéricos.
     
     Args:
-        df (pd.DataFrame): DataFrame a verificar
-        columnas (list): Lista de columnas a verificar. Si es None, verifica todas
+        df (pd.DataFrame): DataFrame que contiene los datos
+        columna (str): Nombre de la columna a verificar
         verbose (bool): Si True, muestra información detallada
+        max_show (int): Máximo de valores no numéricos a mostrar en el detalle.
+            Si es None, se muestran todos. El resultado siempre los incluye todos
+        downcast (bool): Si True y la columna es numérica, se reemplaza en df
+            por su versión con el tipo numérico más pequeño posible
+        usar_cache (bool): Si True, reutiliza el resultado de una verificación
+            anterior de la misma columna si su contenido no cambió. Calcular
+            la huella del contenido cuesta casi tanto como verificar la
+            columna: si no está en el cache la verificación tarda hasta el
+            doble, y si está el ahorro es pequeño
     
     Returns:
-        dict: Diccionario con resultados por columna
-    """
-    if columnas is None:
-        columnas = df.columns.tolist()
+        dict: Diccionario con información sobre la verificación:
+            - 'es_numerica': bool, True si todos los datos son numéricos
+            - 'tipo_dato': tipo de dato de la columna
+            - 'valores_no_numericos': lista de valores no numéricos encontrados
+              (None si verbose es False)
+            - 'cantidad_no_numericos': cantidad de valores no numéricos
+            - 'indices_no_numericos': pd.Index con los índices donde están los
+              valores no numéricos (sirve directamente para df.drop o df.loc)
+            - 'mask_no_numericos': np.ndarray booleano, True en las filas con
+              valores no numéricos
     
-    resultados = {}
+    Raises:
+        ValueError: Si la columna no existe en el DataFrame o max_show es negativo
+    """
     
-    if verbose:
-        print("=" * 60)
-        print("VERIFICACIÓN DE COLUMNAS NUMÉRICAS")
-        print("=" * 60 + "\n")
+    # Verificar que la columna existe
+    if columna not in df.columns:
+        raise ValueError(f"La columna '{columna}' no existe en el DataFrame. "
+                        f"Columnas disponibles: {list(df.columns)}")
+    if max_show is not None and max_show < 0:
+        raise ValueError(f"max_show debe ser mayor o igual que 0 (recibido: {max_show})")
     
-    for col in columnas:
-        if verbose:
-            print(f"\n--- Columna: {col} ---")
-        
-        resultado = verificar_columna_numerica(df, col, verbose=verbose)
-        resultados[col] = resultado
+    # Obtener la serie
+    serie = df[columna]
+    resultado = _verificar_serie(serie, columna, verbose=verbose, max_show=max_show,
+                                 usar_cache=usar_cache)
     
-    # Resumen final
-    if verbose:
-        print("\n" + "=" * 60)
-        print("RESUMEN")
-        print("=" * 60)
-        
-        numericas = [col for col, res in resultados.items() if res['es_numerica']]
-        no_numericas = [col for col, res in resultados.items() if not res['es_numerica']]
-        
-        print(f"\n✓ Columnas numéricas ({len(numericas)}):")
-        for col in numericas:
-            print(f"  - {col}")
-        
-        if no_numericas:
-            print(f"\n✗ Columnas NO numéricas ({len(no_numericas)}):")
-            for col in no_numericas:
-                cant = resultados[col]['cantidad_no_numericos']
-                print(f"  - {col} ({cant} valores problemáticos)")
+    if downcast and pd.api.types.is_numeric_dtype(serie):
+        df[columna] = _reducir_tipo(serie)
     
-    return resultados
+    return resultado
 
 
-def verificar_multiples_columnas(df, columnas=None, verbose=True):
+def verificar_multiples_columnas(df, columnas=None, verbose=True, n_jobs=1, max_show=50,
+                                 downcast=False, usar_cache=False):
     """
     Verifica múltiples columnas del DataFrame.
+    
+    Args:
+        df (pd.DataFrame): DataFrame a verificar
+        columnas (list): Lista de columnas a verificar. Si es None, verifica todas
+        verbose (bool): Si True, muestra información detallada
+        n_jobs (int): Número de procesos para verificar columnas en paralelo
+            (-1 usa todos los núcleos). El resultado y la salida son los
+            mismos que en modo secuencial; el detalle de cada columna se
+            muestra cuando terminan todas
+        max_show (int): Máximo de valores no numéricos a mostrar por columna.
+            Si es None, se muestran todos. El resultado siempre los incluye todos
+        downcast (bool): Si True, después de verificar se reducen en df los
+            tipos de las columnas (numéricas al tipo más pequeño posible y
+            de texto con pocos valores distintos a 'category')
+        usar_cache (bool): Si True, las columnas que ya se verificaron antes con
+            el mismo contenido no se vuelven a recorrer. Calcular la huella
+            de una columna cuesta casi tanto como verificarla: si la columna
+            no está en el cache la verificación tarda hasta el doble, y si
+            está el ahorro es pequeño. Con n_jobs distinto de 1 cada proceso
+            tiene su propio cache, así que una columna solo se reutiliza si
+            vuelve a tocarle al mismo proceso, y el cache de este proceso no
+            cambia
+    
+    Returns:
+        dict: Diccionario con resultados por columna
+    
+    Raises:
+        ValueError: Si alguna de las columnas no existe en el DataFrame o
+            max_show es negativo
     """
+    if max_show is not None and max_show < 0:
+        raise ValueError(f"max_show debe ser mayor o igual que 0 (recibido: {max_show})")
+    
     if columnas is None:
         columnas = df.columns.tolist()
     
+    # Verificar de una vez que todas las columnas existen
+    disponibles = set(df.columns)
+    for col in columnas:
+        if col not in disponibles:
+            raise ValueError(f"La columna '{col}' no existe en el DataFrame. "
+                            f"Columnas disponibles: {list(df.columns)}")
+    
     resultados = {}
     
     if verbose:
@@ -196,12 +600,34 @@ def verificar_multiples_columnas(df, columnas=None, verbose=True):
         print("VERIFICACIÓN DE COLUMNAS NUMÉRICAS")
         print("=" * 60 + "\n")
     
-    for col in columnas:
-        if verbose:
-            print(f"\n--- Columna: {col} ---")
+    if n_jobs == 1:
+        for col in columnas:
+            if verbose:
+                print(f"\n--- Columna: {col} ---")
+            
+            resultado = _verificar_serie(df[col], col, verbose=verbose,
+                                         max_show=max_show, usar_cache=usar_cache)
+            resultados[col] = resultado
+    else:
+        # Las columnas son independientes: se verifican en paralelo enviando
+        # a cada tarea solo su columna. El detalle se muestra después, en
+        # orden, para no mezclar las salidas de los procesos
+        resultados_columnas = Parallel(n_jobs=n_jobs)(
+            delayed(_verificar_serie)(df[col], col, verbose=verbose, max_show=max_show,
+                                      usar_cache=usar_cache, mostrar=False)
+            for col in columnas
+        )
+        resultados = dict(zip(columnas, resultados_columnas))
         
-        resultado = verificar_columna_numerica(df, col, verbose=verbose)
-        resultados[col] = resultado
+        if verbose:
+            for col in columnas:
+                print(f"\n--- Columna: {col} ---")
+                _mostrar_resultado(resultados[col], col, max_show,
+                                   tipo_numerico=pd.api.types.is_numeric_dtype(df[col]))
+    
+    if downcast:
+        for col in columnas:
+            df[col] = _reducir_tipo(df[col])
     
     # Resumen final
     if verbose:
@@ -223,6 +649,3 @@ def verificar_multiples_columnas(df, columnas=None, verbose=True):
                 print(f"  - {col} ({cant} valores problemáticos)")
     
     return resultados
-
-
-
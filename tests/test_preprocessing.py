@@ -0,0 +1,187 @@
+import re
+
+import pandas as pd
+import pytest
+
+from src.data import preprocessing
+from src.data.preprocessing import verificar_columna_numerica, verificar_multiples_columnas
+
+
+def test_cache_respeta_el_orden_de_las_filas():
+    df = pd.DataFrame({'a': pd.Series(['x', '1', '2', '3'], dtype=object)})
+    invertido = df.iloc[::-1].reset_index(drop=True)
+
+    primero = verificar_multiples_columnas(df, verbose=False, usar_cache=True)
+    segundo = verificar_multiples_columnas(invertido, verbose=False, usar_cache=True)
+
+    assert list(primero['a']['indices_no_numericos']) == [0]
+    assert list(segundo['a']['indices_no_numericos']) == [3]
+
+
+def test_cache_no_comparte_la_mascara_devuelta():
+    df = pd.DataFrame({'a': pd.Series(['x', '1', '2', '3'], dtype=object)})
+
+    resultado = verificar_multiples_columnas(df, verbose=False, usar_cache=True)
+    resultado['a']['mask_no_numericos'][:] = True
+
+    repetido = verificar_multiples_columnas(df, verbose=False, usar_cache=True)
+    assert list(repetido['a']['indices_no_numericos']) == [0]
+
+
+def test_cache_distingue_el_tipo_de_cada_valor():
+    # hash_pandas_object da el mismo hash a True y a 'True'
+    df = pd.DataFrame({'a': pd.Series([True, 'True'], dtype=object)})
+    invertido = pd.DataFrame({'a': pd.Series(['True', True], dtype=object)})
+
+    primero = verificar_columna_numerica(df, 'a', verbose=False, usar_cache=True)
+    segundo = verificar_columna_numerica(invertido, 'a', verbose=False, usar_cache=True)
+
+    assert list(primero['indices_no_numericos']) == [1]
+    assert list(segundo['indices_no_numericos']) == [0]
+
+
+def _es_numero(valor):
+    # Referencia: la misma regla que float() sobre el valor sin espacios
+    try:
+        float(valor.strip() if isinstance(valor, str) else valor)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+VALORES = ['1', ' 2.5 ', 'x', None, '3e2', 'abc', '-4', '']
+
+
+# Casos en los que pd.to_numeric, Arrow o un parser propio difieren de float()
+VALORES_DIFICILES = [
+    '\xa01\xa0', '　1　', '\x1c1\x1f', '1\n', 'abc\n', '1\x00', '4E\t1',
+    'nan', 'NaN', '-nan', 'inf', '-Infinity', 'INF', 'infinit', 'nano', 'Tiffany',
+    '1_000', '_1', '1__0', '1_', '١٢', '1١', '１２', '½', '²',
+    '.', '5.', '.5', '1e', '1E+5', '1e500', '+-1', '1.5.2', '0x10', '1,5', 'True',
+    '', ' ', '\t', '\ud800', '1\ud800',
+]
+
+
+@pytest.fixture(params=['arrow', 'float'])
+def motor_texto(request, monkeypatch):
+    if request.param == 'arrow':
+        pytest.importorskip('pyarrow')
+    else:
+        monkeypatch.setattr(preprocessing, 'pa', None)
+    return request.param
+
+
+def _preparar_caso(caso, valores, monkeypatch):
+    if caso == 'unicos':
+        # Muchas repeticiones: se verifican solo los valores únicos
+        return valores * 10
+    # Casi todos distintos: se verifica la columna completa
+    valores = valores + [str(i) for i in range(100)]
+    if caso == 'bloques':
+        monkeypatch.setattr(preprocessing, 'TAMANO_TRAMO', 2)
+        monkeypatch.setattr(preprocessing, 'TAMANO_BLOQUE', 3)
+    if caso == 'mezclada':
+        valores = valores + [7, 2.5, True, [1]]
+    return valores
+
+
+@pytest.mark.parametrize('caso', ['unicos', 'completa', 'bloques', 'mezclada'])
+def test_todas_las_ramas_detectan_los_mismos_valores(caso, motor_texto, monkeypatch):
+    valores = _preparar_caso(caso, VALORES, monkeypatch)
+
+    df = pd.DataFrame({'a': pd.Series(valores, dtype=object)})
+    resultado = verificar_columna_numerica(df, 'a', verbose=False)
+
+    esperados = [i for i, v in enumerate(valores) if v is not None and not _es_numero(v)]
+    assert list(resultado['indices_no_numericos']) == esperados
+
+
+@pytest.mark.parametrize('caso', ['unicos', 'completa', 'bloques', 'mezclada'])
+def test_valores_dificiles_coinciden_con_float(caso, motor_texto, monkeypatch):
+    valores = _preparar_caso(caso, VALORES_DIFICILES, monkeypatch)
+
+    df = pd.DataFrame({'a': pd.Series(valores, dtype=object)})
+    resultado = verificar_columna_numerica(df, 'a', verbose=False)
+
+    esperados = [i for i, v in enumerate(valores) if not _es_numero(v)]
+    assert list(resultado['indices_no_numericos']) == esperados
+
+
+def test_patron_no_numerico_solo_rechaza_caracteres_invalidos():
+    for codigo in range(128):
+        caracter = chr(codigo)
+        if re.search(preprocessing.PATRON_NO_NUMERICO, caracter):
+            for texto in (caracter, '1' + caracter, caracter + '1', '1' + caracter + '1'):
+                assert not _es_numero(texto), repr(texto)
+
+
+def test_downcast_no_pierde_precision():
+    df = pd.DataFrame({
+        'exacta': [0.5, 1.25, float('nan')],
+        'inexacta': [0.1234567891, 1234.56789, 3.3],
+        'entera': [1, 2, 300],
+    })
+    original = df.copy()
+
+    verificar_multiples_columnas(df, verbose=False, downcast=True)
+
+    assert df['exacta'].dtype == 'float32'
+    assert df['inexacta'].dtype == 'float64'
+    assert df['entera'].dtype == 'int16'
+    pd.testing.assert_frame_equal(df.astype('float64'), original.astype('float64'))
+
+
+def test_modo_paralelo_devuelve_lo_mismo_que_el_secuencial(capsys):
+    df = pd.DataFrame({
+        'a': pd.Series([1, ' 2.5 ', None, 'x', 3.0, 'abc'], dtype=object),
+        'b': pd.Series(['u', 'v', 'u', '1', 'v', None], dtype=object),
+        'c': [0.5, 1.0, 2.0, 3.0, 4.0, 5.0],
+    })
+
+    secuencial = verificar_multiples_columnas(df, verbose=True, max_show=1)
+    salida_secuencial = capsys.readouterr().out
+    paralelo = verificar_multiples_columnas(df, verbose=True, max_show=1, n_jobs=2)
+    salida_paralela = capsys.readouterr().out
+
+    assert salida_paralela == salida_secuencial
+    for col in df.columns:
+        assert paralelo[col]['valores_no_numericos'] == secuencial[col]['valores_no_numericos']
+        assert list(paralelo[col]['indices_no_numericos']) == list(secuencial[col]['indices_no_numericos'])
+
+
+def test_max_show_trunca_solo_la_salida(capsys):
+    df = pd.DataFrame({'a': pd.Series(['x', '1', 'y', '2'], dtype=object)})
+
+    resultado = verificar_columna_numerica(df, 'a', max_show=1)
+    salida = capsys.readouterr().out
+
+    assert "... (1 filas omitidas)" in salida
+    assert ' x ' in salida and ' y ' not in salida
+    assert resultado['valores_no_numericos'] == ['x', 'y']
+
+    verificar_columna_numerica(df, 'a', max_show=0)
+    salida = capsys.readouterr().out
+    assert 'Empty DataFrame' not in salida
+    assert "... (2 filas omitidas)" in salida
+
+
+def test_max_show_negativo_falla():
+    df = pd.DataFrame({'a': ['x', '1']})
+
+    with pytest.raises(ValueError):
+        verificar_columna_numerica(df, 'a', max_show=-1)
+    with pytest.raises(ValueError):
+        verificar_multiples_columnas(df, max_show=-1)
+
+
+def test_resultado_sirve_para_filtrar_el_dataframe():
+    df = pd.DataFrame({'a': ['1', 'x', None, '2.5', 'y']}, index=[10, 20, 30, 40, 50])
+
+    resultado = verificar_columna_numerica(df, 'a', verbose=False)
+
+    assert resultado['valores_no_numericos'] is None
+    assert list(resultado['indices_no_numericos']) == [20, 50]
+    assert list(df.index[resultado['mask_no_numericos']]) == [20, 50]
+    limpio = df.drop(resultado['indices_no_numericos'])
+    assert list(limpio.index) == [10, 30, 40]
+    assert list(df.loc[~resultado['mask_no_numericos']].index) == [10, 30, 40]